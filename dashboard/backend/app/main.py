@@ -1,12 +1,16 @@
 from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
-from pydantic import BaseModel
-from typing import Optional
-import os, re, logging
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict
+from typing import Generic, Optional, TypeVar
+import os, re, logging, asyncio, hashlib
+import orjson
 from dotenv import load_dotenv
-from datetime import datetime, date, timedelta, timezone, time
+from datetime import datetime, date, timedelta, timezone
 
 load_dotenv()
 
@@ -16,7 +20,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger("dashboard")
 
-app = FastAPI(title="SbioChat Dashboard API")
+app = FastAPI(title="SbioChat Dashboard API", default_response_class=ORJSONResponse)
 v1 = APIRouter(prefix="/api/v1")
 
 KST = timezone(timedelta(hours=9))
@@ -44,20 +48,51 @@ DB_HOST = os.getenv("POSTGRES_HOST", "webui-db")
 DB_PORT = os.getenv("POSTGRES_PORT", "5432")
 DB_NAME = os.getenv("POSTGRES_DB", "webui")
 
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 AUTH_MODE = os.getenv("AUTH_MODE", "mock")
-ADMIN_USERS = [u.strip() for u in os.getenv("ADMIN_USERS", "jisung.jang").split(",") if u.strip()]
+ADMIN_USERS = frozenset(u.strip() for u in os.getenv("ADMIN_USERS", "jisung.jang").split(",") if u.strip())
+PACKAGE_NAME_RE = re.compile(r'^[a-zA-Z0-9._\-\[\]>=<!, ]+$')
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Stats materialized views, refreshed in the background every MV_REFRESH_INTERVAL seconds
+MV_REFRESH_INTERVAL = int(os.getenv("MV_REFRESH_INTERVAL", "300"))
+MATERIALIZED_VIEWS = ("mv_overview_stats", "mv_chat_daily_kst", "mv_workspace_metrics", "mv_workspace_feedback")
 
-def get_db():
-    db = SessionLocal()
-    try:
+# Public stats responses are cached in-process for as long as clients may cache them (max-age=60)
+STATS_CACHE_TTL = 60
+_stats_cache = TTLCache(maxsize=512, ttl=STATS_CACHE_TTL)
+
+
+def compute_etag(result) -> str:
+    return f'"{hashlib.md5(orjson.dumps(result, default=str)).hexdigest()}"'
+
+
+def stats_response(request: Request, response: Response, result, etag: str):
+    """Return a cached stats body, or an empty 304 when the client already holds it."""
+    # nginx weakens ETags when it gzips, so compare the opaque tag only
+    if request.headers.get("If-None-Match", "").removeprefix("W/") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": response.headers["Cache-Control"]})
+    response.headers["ETag"] = etag
+    return result
+
+
+# Pool limits are per worker process; keep workers * (size + overflow) under Postgres max_connections
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "5"))
+
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 def get_current_user(request: Request) -> str:
@@ -94,12 +129,174 @@ class ReportStatusUpdate(BaseModel):
     admin_note: Optional[str] = None
 
 
+class ResponseModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+T = TypeVar("T")
+
+class Page(ResponseModel, Generic[T]):
+    total: int
+    offset: int
+    limit: int
+    items: list[T]
+
+class OverviewOut(ResponseModel):
+    total_chats: int
+    total_messages: int
+    total_models: int
+    total_feedbacks: int
+    total_tools: int
+    total_functions: int
+    total_skills: int
+
+class DailyStat(ResponseModel):
+    date: str
+    chat_count: int
+    message_count: int
+    user_count: int
+
+class WorkspaceRankingItem(ResponseModel):
+    id: str
+    name: str
+    developer_email: str
+    user_count: int
+    chat_count: int
+    message_count: int
+    positive: int
+    negative: int
+
+class DeveloperRankingItem(ResponseModel):
+    user_id: str
+    user_name: str
+    email: str
+    workspace_count: int
+    total_users: int
+    total_chats: int
+    total_messages: int
+    total_positive: int
+    total_negative: int
+
+class UserRankingItem(ResponseModel):
+    user_id: str
+    user_name: str
+    email: str
+    chat_count: int
+    message_count: int
+    workspace_count: int
+    total_feedbacks: int
+
+class GroupRankingItem(ResponseModel):
+    group_id: str
+    group_name: str
+    member_count: int
+    total_chats: int
+    total_messages: int
+    total_feedbacks: int
+    chats_per_member: float
+    messages_per_member: float
+
+class ToolRankingItem(ResponseModel):
+    id: str
+    name: str
+    creator_name: str
+    creator_email: str
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+class FunctionRankingItem(ResponseModel):
+    id: str
+    name: str
+    type: Optional[str] = None
+    is_active: Optional[bool] = None
+    is_global: Optional[bool] = None
+    creator_name: str
+    creator_email: str
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+class SkillRankingItem(ResponseModel):
+    id: str
+    name: str
+    description: str
+    is_active: Optional[bool] = None
+    creator_name: str
+    creator_email: str
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+class AuditLogEntry(ResponseModel):
+    id: int
+    package_id: Optional[int] = None
+    package_name: str
+    action: str
+    performed_by: str
+    detail: Optional[str] = None
+    created_at: str
+
+class PackageOut(ResponseModel):
+    id: int
+    package_name: str
+    added_by: str
+    added_at: str
+    status: str
+    status_note: Optional[str] = None
+
+
+CHAT_INDEXES = {
+    "idx_chat_created_at": "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chat_created_at ON chat USING brin (created_at)",
+    "idx_chat_kst_date": """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chat_kst_date
+        ON chat (((to_timestamp(created_at) AT TIME ZONE 'Asia/Seoul')::date))
+    """,
+}
+
+CHAT_INDEX_INVALID_SQL = text("""
+    SELECT NOT i.indisvalid
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE c.relname = :name AND i.indrelid = 'chat'::regclass
+""")
+
+
 @app.on_event("startup")
-def create_tables():
-    """Create application tables if they don't exist."""
-    logger.info("Starting dashboard API, AUTH_MODE=%s, ADMIN_USERS=%s", AUTH_MODE, ADMIN_USERS)
-    with engine.connect() as conn:
-        conn.execute(text("""
+async def create_tables():
+    """Create application tables and stats materialized views if they don't exist."""
+    logger.info("Starting dashboard API, AUTH_MODE=%s, ADMIN_USERS=%s", AUTH_MODE, sorted(ADMIN_USERS))
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        # Stored message count so stats queries don't re-parse the chat JSON per row.
+        # ALTER TABLE takes ACCESS EXCLUSIVE on Open WebUI's chat table even with IF NOT EXISTS,
+        # so only run it when the column is missing or predates the non-array guard, in its
+        # own short transaction with a lock timeout instead of queueing chat reads and writes.
+        await raw.driver_connection.execute("""
+            SELECT pg_advisory_xact_lock(hashtext('dashboard_ddl'));
+            SET LOCAL lock_timeout = '5s';
+            DO $$
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1
+                    FROM pg_attribute a
+                    JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+                    WHERE a.attrelid = 'chat'::regclass
+                      AND a.attname = 'message_count'
+                      AND NOT a.attisdropped
+                      AND pg_get_expr(d.adbin, d.adrelid) LIKE '%json_typeof%'
+                ) THEN
+                    -- CASCADE drops the mv_* views built on the old column; they are recreated below
+                    ALTER TABLE chat DROP COLUMN IF EXISTS message_count CASCADE;
+                    ALTER TABLE chat ADD COLUMN message_count INTEGER GENERATED ALWAYS AS (
+                        CASE WHEN json_typeof(chat->'messages') = 'array'
+                             THEN json_array_length(chat->'messages') END
+                    ) STORED;
+                END IF;
+            END $$;
+        """)
+        # Without bind parameters asyncpg sends the whole script as one simple-protocol query,
+        # which Postgres runs as a single implicit transaction
+        await raw.driver_connection.execute("""
+            -- Serialize startup DDL across gunicorn workers
+            SELECT pg_advisory_xact_lock(hashtext('dashboard_ddl'));
+
             CREATE TABLE IF NOT EXISTS python_packages (
                 id SERIAL PRIMARY KEY,
                 package_name VARCHAR(255) NOT NULL UNIQUE,
@@ -109,9 +306,8 @@ def create_tables():
                 status_note TEXT,
                 status_updated_by VARCHAR(255),
                 status_updated_at TIMESTAMPTZ
-            )
-        """))
-        conn.execute(text("""
+            );
+
             CREATE TABLE IF NOT EXISTS package_audit_log (
                 id SERIAL PRIMARY KEY,
                 package_id INTEGER,
@@ -120,9 +316,8 @@ def create_tables():
                 performed_by VARCHAR(255) NOT NULL,
                 detail TEXT,
                 created_at TIMESTAMPTZ DEFAULT NOW()
-            )
-        """))
-        conn.execute(text("""
+            );
+
             CREATE TABLE IF NOT EXISTS issue_reports (
                 id SERIAL PRIMARY KEY,
                 title VARCHAR(255) NOT NULL,
@@ -135,31 +330,153 @@ def create_tables():
                 status_updated_by VARCHAR(255),
                 created_at TIMESTAMPTZ DEFAULT NOW(),
                 updated_at TIMESTAMPTZ DEFAULT NOW()
-            )
-        """))
-        conn.commit()
+            );
+
+            CREATE TABLE IF NOT EXISTS mv_refresh_state (
+                view_name VARCHAR(63) PRIMARY KEY,
+                refreshed_at TIMESTAMPTZ NOT NULL
+            );
+
+            -- Unique indexes are required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+            CREATE MATERIALIZED VIEW IF NOT EXISTS mv_overview_stats AS
+            WITH
+                chat_stats AS (
+                    SELECT count(*) as total_chats,
+                           sum(message_count) as total_messages
+                    FROM chat
+                ),
+                model_stats AS (
+                    SELECT count(DISTINCT m.value) as total_models
+                    FROM chat, json_array_elements_text(chat->'models') AS m(value)
+                )
+            SELECT 1 as id, cs.total_chats, cs.total_messages, ms.total_models
+            FROM chat_stats cs, model_stats ms;
+
+            CREATE UNIQUE INDEX IF NOT EXISTS mv_overview_stats_id ON mv_overview_stats (id);
+
+            CREATE MATERIALIZED VIEW IF NOT EXISTS mv_chat_daily_kst AS
+            SELECT
+                (to_timestamp(created_at) AT TIME ZONE 'Asia/Seoul')::date as date,
+                count(*) as chat_count,
+                sum(message_count) as message_count,
+                count(DISTINCT user_id) as user_count
+            FROM chat
+            GROUP BY 1;
+
+            CREATE UNIQUE INDEX IF NOT EXISTS mv_chat_daily_kst_date ON mv_chat_daily_kst (date);
+
+            CREATE MATERIALIZED VIEW IF NOT EXISTS mv_workspace_metrics AS
+            SELECT
+                m.value as workspace,
+                count(*) as chat_count,
+                sum(c.message_count) as message_count,
+                count(DISTINCT c.user_id) as user_count
+            FROM chat c
+            CROSS JOIN LATERAL json_array_elements_text(c.chat->'models') AS m(value)
+            WHERE m.value IS NOT NULL
+            GROUP BY m.value;
 
+            CREATE UNIQUE INDEX IF NOT EXISTS mv_workspace_metrics_workspace ON mv_workspace_metrics (workspace);
 
-def log_audit(db: Session, package_id: int, package_name: str, action: str, user: str, detail: str = None):
-    """Insert a record into the package audit log."""
-    db.execute(
-        text("""INSERT INTO package_audit_log (package_id, package_name, action, performed_by, detail)
-                VALUES (:pid, :pname, :action, :user, :detail)"""),
-        {"pid": package_id, "pname": package_name, "action": action, "user": user, "detail": detail},
+            CREATE MATERIALIZED VIEW IF NOT EXISTS mv_workspace_feedback AS
+            SELECT
+                f.data->>'model_id' as workspace,
+                count(*) FILTER (WHERE (f.data->>'rating')::int > 0) as positive,
+                count(*) FILTER (WHERE (f.data->>'rating')::int < 0) as negative
+            FROM feedback f
+            WHERE f.data->>'model_id' IS NOT NULL
+            GROUP BY f.data->>'model_id';
+
+            CREATE UNIQUE INDEX IF NOT EXISTS mv_workspace_feedback_workspace ON mv_workspace_feedback (workspace);
+
+            -- Support ORDER BY ... LIMIT pagination on the package and audit-log lists
+            CREATE INDEX IF NOT EXISTS idx_pkg_added_at ON python_packages (added_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_audit_created_at ON package_audit_log (created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_audit_package_id ON package_audit_log (package_id);
+        """)
+    # Indexes on Open WebUI's chat table are built CONCURRENTLY so chat writes are never blocked.
+    # Only one worker builds them; the others skip instead of waiting on each other.
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        if not (await conn.execute(text("SELECT pg_try_advisory_lock(hashtext('dashboard_chat_indexes'))"))).scalar():
+            return
+        try:
+            for name, ddl in CHAT_INDEXES.items():
+                try:
+                    # A failed concurrent build leaves an INVALID index that IF NOT EXISTS would skip forever
+                    if (await conn.execute(CHAT_INDEX_INVALID_SQL, {"name": name})).scalar():
+                        logger.warning("Rebuilding invalid index %s on chat", name)
+                        await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                    await conn.execute(text(ddl))
+                except Exception:
+                    logger.exception("Failed to build index %s on chat", name)
+        finally:
+            await conn.execute(text("SELECT pg_advisory_unlock(hashtext('dashboard_chat_indexes'))"))
+
+
+MV_REFRESH_DUE_SQL = text("""
+    SELECT NOT EXISTS (
+        SELECT 1 FROM mv_refresh_state
+        WHERE view_name = :view
+          AND refreshed_at > now() - make_interval(secs => :interval)
     )
+""")
+
+MV_REFRESHED_SQL = text("""
+    INSERT INTO mv_refresh_state (view_name, refreshed_at)
+    VALUES (:view, now())
+    ON CONFLICT (view_name) DO UPDATE SET refreshed_at = EXCLUDED.refreshed_at
+""")
+
+
+async def refresh_materialized_views():
+    """Periodically refresh the stats materialized views without blocking readers."""
+    while True:
+        await asyncio.sleep(MV_REFRESH_INTERVAL)
+        for view in MATERIALIZED_VIEWS:
+            try:
+                async with engine.begin() as conn:
+                    # Every worker runs this loop on its own timer. The lock keeps refreshes from
+                    # overlapping and refreshed_at makes later workers skip a view that is still fresh.
+                    locked = (await conn.execute(
+                        text("SELECT pg_try_advisory_xact_lock(hashtext(:view))"), {"view": view}
+                    )).scalar()
+                    if not locked:
+                        continue
+                    due = (await conn.execute(
+                        MV_REFRESH_DUE_SQL, {"view": view, "interval": MV_REFRESH_INTERVAL}
+                    )).scalar()
+                    if due:
+                        await conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+                        await conn.execute(MV_REFRESHED_SQL, {"view": view})
+            except Exception:
+                logger.exception("Failed to refresh materialized view %s", view)
+
+
+@app.on_event("startup")
+async def start_mv_refresh():
+    app.state.mv_refresh_task = asyncio.create_task(refresh_materialized_views())
+
+
+@app.on_event("shutdown")
+async def stop_mv_refresh():
+    app.state.mv_refresh_task.cancel()
 
 
 # ─── Root & Health ────────────────────────────────────────────────────
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Welcome to Open WebUI Dashboard API"}
 
 
+HEALTH_CHECK_SQL = text("SELECT 1")
+
+
 @app.get("/health")
-def health_check(db: Session = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_db)):
     try:
-        db.execute(text("SELECT 1"))
+        await db.execute(HEALTH_CHECK_SQL)
         return {"status": "ok", "database": "connected"}
     except Exception as e:
         logger.exception("Health check failed")
@@ -168,54 +485,64 @@ def health_check(db: Session = Depends(get_db)):
 
 # ─── Statistics ───────────────────────────────────────────────────────
 
-@v1.get("/stats/overview")
-def get_overview(response: Response, db: Session = Depends(get_db)):
+OVERVIEW_SQL = text("""
+    WITH
+        feedback_stats AS (
+            SELECT count(*) as total_feedbacks FROM feedback
+        ),
+        tool_stats AS (
+            SELECT count(*) as total_tools FROM tool
+        ),
+        function_stats AS (
+            SELECT count(*) as total_functions FROM function
+        ),
+        skill_stats AS (
+            SELECT count(*) as total_skills FROM skill
+        )
+    SELECT ov.total_chats, ov.total_messages, ov.total_models, fs.total_feedbacks,
+           ts.total_tools, fns.total_functions, ss.total_skills
+    FROM mv_overview_stats ov, feedback_stats fs, tool_stats ts, function_stats fns, skill_stats ss
+""")
+
+
+@v1.get("/stats/overview", response_model=OverviewOut)
+async def get_overview(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
     """Return aggregate stats across all chats, models, and feedback."""
     response.headers["Cache-Control"] = "public, max-age=60"
-    result = db.execute(text("""
-        WITH
-            chat_stats AS (
-                SELECT count(*) as total_chats,
-                       sum(json_array_length(chat->'messages')) as total_messages
-                FROM chat
-            ),
-            model_stats AS (
-                SELECT count(DISTINCT m.value) as total_models
-                FROM chat, json_array_elements_text(chat->'models') AS m(value)
-            ),
-            feedback_stats AS (
-                SELECT count(*) as total_feedbacks FROM feedback
-            ),
-            tool_stats AS (
-                SELECT count(*) as total_tools FROM tool
-            ),
-            function_stats AS (
-                SELECT count(*) as total_functions FROM function
-            ),
-            skill_stats AS (
-                SELECT count(*) as total_skills FROM skill
-            )
-        SELECT cs.total_chats, cs.total_messages, ms.total_models, fs.total_feedbacks,
-               ts.total_tools, fns.total_functions, ss.total_skills
-        FROM chat_stats cs, model_stats ms, feedback_stats fs, tool_stats ts, function_stats fns, skill_stats ss
-    """)).mappings().first()
-    return {
-        "total_chats": result["total_chats"],
-        "total_messages": result["total_messages"] or 0,
-        "total_models": result["total_models"],
-        "total_feedbacks": result["total_feedbacks"],
-        "total_tools": result["total_tools"],
-        "total_functions": result["total_functions"],
-        "total_skills": result["total_skills"],
+    cache_key = ("overview",)
+    cached = _stats_cache.get(cache_key)
+    if cached:
+        return stats_response(request, response, *cached)
+    row = (await db.execute(OVERVIEW_SQL)).mappings().first()
+    result = {
+        "total_chats": row["total_chats"],
+        "total_messages": row["total_messages"] or 0,
+        "total_models": row["total_models"],
+        "total_feedbacks": row["total_feedbacks"],
+        "total_tools": row["total_tools"],
+        "total_functions": row["total_functions"],
+        "total_skills": row["total_skills"],
     }
+    etag = compute_etag(result)
+    _stats_cache[cache_key] = (result, etag)
+    return stats_response(request, response, result, etag)
 
 
-@v1.get("/stats/daily")
-def get_daily_stats(
+DAILY_STATS_SQL = text("""
+    SELECT date, chat_count, message_count, user_count
+    FROM mv_chat_daily_kst
+    WHERE date BETWEEN :date_from AND :date_to
+    ORDER BY date
+""")
+
+
+@v1.get("/stats/daily", response_model=list[DailyStat])
+async def get_daily_stats(
+    request: Request,
     response: Response,
     date_from: date = Query(alias="from", default=None),
     date_to: date = Query(alias="to", default=None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     response.headers["Cache-Control"] = "public, max-age=60"
     # Default: last 30 days in KST
@@ -224,21 +551,12 @@ def get_daily_stats(
     if date_from is None:
         date_from = date_to - timedelta(days=29)
 
-    # Convert KST date range to UTC epoch range
-    from_utc = datetime.combine(date_from, time.min, tzinfo=KST).timestamp()
-    to_utc = datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=KST).timestamp()
+    cache_key = ("daily", date_from, date_to)
+    cached = _stats_cache.get(cache_key)
+    if cached:
+        return stats_response(request, response, *cached)
 
-    rows = db.execute(text("""
-        SELECT
-            (to_timestamp(created_at) AT TIME ZONE 'Asia/Seoul')::date as date,
-            count(*) as chat_count,
-            sum(json_array_length(chat->'messages')) as message_count,
-            count(DISTINCT user_id) as user_count
-        FROM chat
-        WHERE created_at >= :from_ts AND created_at < :to_ts
-        GROUP BY date
-        ORDER BY date
-    """), {"from_ts": from_utc, "to_ts": to_utc}).mappings().all()
+    rows = (await db.execute(DAILY_STATS_SQL, {"date_from": date_from, "date_to": date_to})).mappings().all()
 
     # Fill missing dates with zeros
     data_by_date = {str(row["date"]): row for row in rows}
@@ -263,605 +581,615 @@ def get_daily_stats(
             })
         current += timedelta(days=1)
 
-    return result
-
-
-@v1.get("/stats/workspace-ranking")
-def get_workspace_ranking(
+    etag = compute_etag(result)
+    _stats_cache[cache_key] = (result, etag)
+    return stats_response(request, response, result, etag)
+
+
+WORKSPACE_RANKING_COUNT_SQL = text("""
+    SELECT count(*)
+    FROM mv_workspace_metrics wm
+    JOIN model mo ON mo.id = wm.workspace
+""")
+
+WORKSPACE_RANKING_SQL = text("""
+    SELECT
+        wc.workspace as id,
+        coalesce(mo.name, wc.workspace) as name,
+        coalesce(u.email, '') as developer_email,
+        wc.user_count,
+        wc.chat_count,
+        coalesce(wc.message_count, 0) as message_count,
+        coalesce(wf.positive, 0) as positive,
+        coalesce(wf.negative, 0) as negative
+    FROM mv_workspace_metrics wc
+    JOIN model mo ON mo.id = wc.workspace
+    LEFT JOIN "user" u ON u.id = mo.user_id
+    LEFT JOIN mv_workspace_feedback wf ON wc.workspace = wf.workspace
+    ORDER BY wc.chat_count DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@v1.get("/stats/workspace-ranking", response_model=Page[WorkspaceRankingItem])
+async def get_workspace_ranking(
+    request: Request,
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     response.headers["Cache-Control"] = "public, max-age=60"
-    rows = db.execute(text("""
-        WITH workspace_chats AS (
-            SELECT
-                m.value as workspace,
-                count(*) as chat_count,
-                sum(json_array_length(c.chat->'messages')) as message_count,
-                count(DISTINCT c.user_id) as user_count
-            FROM chat c, json_array_elements_text(c.chat->'models') AS m(value)
-            GROUP BY m.value
-        ),
-        workspace_feedback AS (
-            SELECT
-                f.data->>'model_id' as workspace,
-                count(*) FILTER (WHERE (f.data->>'rating')::int > 0) as positive,
-                count(*) FILTER (WHERE (f.data->>'rating')::int < 0) as negative
-            FROM feedback f
-            GROUP BY f.data->>'model_id'
-        ),
-        workspace_info AS (
-            SELECT m.id, m.name, u.email as developer_email
-            FROM model m
-            LEFT JOIN "user" u ON m.user_id = u.id
-        )
-        SELECT
-            wc.workspace as id,
-            coalesce(wi.name, wc.workspace) as name,
-            wi.developer_email,
-            wc.chat_count,
-            wc.message_count,
-            wc.user_count,
-            coalesce(wf.positive, 0) as positive,
-            coalesce(wf.negative, 0) as negative,
-            count(*) OVER() as _total
-        FROM workspace_chats wc
-        JOIN workspace_info wi ON wc.workspace = wi.id
-        LEFT JOIN workspace_feedback wf ON wc.workspace = wf.workspace
-        ORDER BY wc.chat_count DESC
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-
-    total = rows[0]["_total"] if rows else 0
-    return {
+    cache_key = ("workspace-ranking", offset, limit)
+    cached = _stats_cache.get(cache_key)
+    if cached:
+        return stats_response(request, response, *cached)
+    total = (await db.execute(WORKSPACE_RANKING_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(WORKSPACE_RANKING_SQL, {"limit": limit, "offset": offset})).mappings().all()
+
+    result = {
         "total": total,
         "offset": offset,
         "limit": limit,
-        "items": [
-            {
-                "id": row["id"],
-                "name": row["name"],
-                "developer_email": row["developer_email"] or "",
-                "user_count": row["user_count"],
-                "chat_count": row["chat_count"],
-                "message_count": row["message_count"] or 0,
-                "positive": row["positive"],
-                "negative": row["negative"],
-            }
-            for row in rows
-        ],
+        "items": [dict(row) for row in rows],
     }
-
-
-@v1.get("/stats/developer-ranking")
-def get_developer_ranking(
+    etag = compute_etag(result)
+    _stats_cache[cache_key] = (result, etag)
+    return stats_response(request, response, result, etag)
+
+
+DEVELOPER_RANKING_COUNT_SQL = text("""
+    SELECT count(DISTINCT m.user_id)
+    FROM model m
+    JOIN "user" u ON m.user_id = u.id
+""")
+
+DEVELOPER_RANKING_SQL = text("""
+    SELECT
+        u.id as user_id,
+        u.name as user_name,
+        u.email,
+        count(DISTINCT mo.id) as workspace_count,
+        coalesce(sum(wm.user_count), 0)::bigint as total_users,
+        coalesce(sum(wm.chat_count), 0)::bigint as total_chats,
+        coalesce(sum(wm.message_count), 0)::bigint as total_messages,
+        coalesce(sum(wfb.positive), 0)::bigint as total_positive,
+        coalesce(sum(wfb.negative), 0)::bigint as total_negative
+    FROM model mo
+    JOIN "user" u ON mo.user_id = u.id
+    LEFT JOIN mv_workspace_metrics wm ON mo.id = wm.workspace
+    LEFT JOIN mv_workspace_feedback wfb ON mo.id = wfb.workspace
+    GROUP BY u.id, u.name, u.email
+    ORDER BY total_chats DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@v1.get("/stats/developer-ranking", response_model=Page[DeveloperRankingItem])
+async def get_developer_ranking(
+    request: Request,
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     response.headers["Cache-Control"] = "public, max-age=60"
-    rows = db.execute(text("""
-        WITH developer_workspaces AS (
-            SELECT m.user_id, m.id as workspace_id
-            FROM model m
-        ),
-        workspace_metrics AS (
-            SELECT
-                mv.value as workspace,
-                count(*) as chat_count,
-                sum(json_array_length(c.chat->'messages')) as message_count,
-                count(DISTINCT c.user_id) as user_count
-            FROM chat c, json_array_elements_text(c.chat->'models') AS mv(value)
-            GROUP BY mv.value
-        ),
-        workspace_fb AS (
-            SELECT
-                f.data->>'model_id' as workspace,
-                count(*) FILTER (WHERE (f.data->>'rating')::int > 0) as positive,
-                count(*) FILTER (WHERE (f.data->>'rating')::int < 0) as negative
-            FROM feedback f
-            GROUP BY f.data->>'model_id'
-        )
-        SELECT
-            u.id as user_id,
-            u.name as user_name,
-            u.email,
-            count(DISTINCT dw.workspace_id) as workspace_count,
-            coalesce(sum(wm.user_count), 0) as total_users,
-            coalesce(sum(wm.chat_count), 0) as total_chats,
-            coalesce(sum(wm.message_count), 0) as total_messages,
-            coalesce(sum(wfb.positive), 0) as total_positive,
-            coalesce(sum(wfb.negative), 0) as total_negative,
-            count(*) OVER() as _total
-        FROM developer_workspaces dw
-        JOIN "user" u ON dw.user_id = u.id
-        LEFT JOIN workspace_metrics wm ON dw.workspace_id = wm.workspace
-        LEFT JOIN workspace_fb wfb ON dw.workspace_id = wfb.workspace
-        GROUP BY u.id, u.name, u.email
-        ORDER BY total_chats DESC
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-
-    total = rows[0]["_total"] if rows else 0
-    return {
+    cache_key = ("developer-ranking", offset, limit)
+    cached = _stats_cache.get(cache_key)
+    if cached:
+        return stats_response(request, response, *cached)
+    total = (await db.execute(DEVELOPER_RANKING_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(DEVELOPER_RANKING_SQL, {"limit": limit, "offset": offset})).mappings().all()
+
+    result = {
         "total": total,
         "offset": offset,
         "limit": limit,
-        "items": [
-            {
-                "user_id": row["user_id"],
-                "user_name": row["user_name"],
-                "email": row["email"],
-                "workspace_count": row["workspace_count"],
-                "total_users": int(row["total_users"]),
-                "total_chats": int(row["total_chats"]),
-                "total_messages": int(row["total_messages"]),
-                "total_positive": int(row["total_positive"]),
-                "total_negative": int(row["total_negative"]),
-            }
-            for row in rows
-        ],
+        "items": [dict(row) for row in rows],
     }
+    etag = compute_etag(result)
+    _stats_cache[cache_key] = (result, etag)
+    return stats_response(request, response, result, etag)
+
 
+USER_RANKING_COUNT_SQL = text("""
+    SELECT count(*)
+    FROM "user" u
+    WHERE EXISTS (
+        SELECT 1 FROM chat c, json_array_elements_text(c.chat->'models') AS m(value)
+        WHERE c.user_id = u.id
+    )
+""")
 
-@v1.get("/stats/user-ranking")
-def get_user_ranking(
+USER_RANKING_SQL = text("""
+    WITH user_chats AS (
+        SELECT
+            c.user_id,
+            count(*) as chat_count,
+            sum(c.message_count) as message_count,
+            count(DISTINCT m.value) as workspace_count
+        FROM chat c, json_array_elements_text(c.chat->'models') AS m(value)
+        GROUP BY c.user_id
+    ),
+    user_fb AS (
+        SELECT
+            f.user_id,
+            count(*) as total_feedbacks
+        FROM feedback f
+        GROUP BY f.user_id
+    )
+    SELECT
+        u.id as user_id,
+        u.name as user_name,
+        u.email,
+        coalesce(uc.chat_count, 0) as chat_count,
+        coalesce(uc.message_count, 0) as message_count,
+        coalesce(uc.workspace_count, 0) as workspace_count,
+        coalesce(ufb.total_feedbacks, 0) as total_feedbacks
+    FROM "user" u
+    LEFT JOIN user_chats uc ON u.id = uc.user_id
+    LEFT JOIN user_fb ufb ON u.id = ufb.user_id
+    WHERE coalesce(uc.chat_count, 0) > 0
+    ORDER BY chat_count DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@v1.get("/stats/user-ranking", response_model=Page[UserRankingItem])
+async def get_user_ranking(
+    request: Request,
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Rank individual users by their personal chat activity."""
     response.headers["Cache-Control"] = "public, max-age=60"
-    rows = db.execute(text("""
-        WITH user_chats AS (
-            SELECT
-                c.user_id,
-                count(*) as chat_count,
-                sum(json_array_length(c.chat->'messages')) as message_count,
-                count(DISTINCT m.value) as workspace_count
-            FROM chat c, json_array_elements_text(c.chat->'models') AS m(value)
-            GROUP BY c.user_id
-        ),
-        user_fb AS (
-            SELECT
-                f.user_id,
-                count(*) as total_feedbacks
-            FROM feedback f
-            GROUP BY f.user_id
-        )
-        SELECT
-            u.id as user_id,
-            u.name as user_name,
-            u.email,
-            coalesce(uc.chat_count, 0) as chat_count,
-            coalesce(uc.message_count, 0) as message_count,
-            coalesce(uc.workspace_count, 0) as workspace_count,
-            coalesce(ufb.total_feedbacks, 0) as total_feedbacks,
-            count(*) OVER() as _total
-        FROM "user" u
-        LEFT JOIN user_chats uc ON u.id = uc.user_id
-        LEFT JOIN user_fb ufb ON u.id = ufb.user_id
-        WHERE coalesce(uc.chat_count, 0) > 0
-        ORDER BY chat_count DESC
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-
-    total = rows[0]["_total"] if rows else 0
-    return {
+    cache_key = ("user-ranking", offset, limit)
+    cached = _stats_cache.get(cache_key)
+    if cached:
+        return stats_response(request, response, *cached)
+    total = (await db.execute(USER_RANKING_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(USER_RANKING_SQL, {"limit": limit, "offset": offset})).mappings().all()
+
+    result = {
         "total": total,
         "offset": offset,
         "limit": limit,
-        "items": [
-            {
-                "user_id": row["user_id"],
-                "user_name": row["user_name"],
-                "email": row["email"],
-                "chat_count": int(row["chat_count"]),
-                "message_count": int(row["message_count"]),
-                "workspace_count": int(row["workspace_count"]),
-                "total_feedbacks": int(row["total_feedbacks"]),
-            }
-            for row in rows
-        ],
+        "items": [dict(row) for row in rows],
     }
+    etag = compute_etag(result)
+    _stats_cache[cache_key] = (result, etag)
+    return stats_response(request, response, result, etag)
+
 
+GROUP_RANKING_COUNT_SQL = text("""
+    SELECT count(DISTINCT gm.group_id)
+    FROM "group" g
+    JOIN group_member gm ON g.id = gm.group_id
+""")
 
-@v1.get("/stats/group-ranking")
-def get_group_ranking(
+GROUP_RANKING_SQL = text("""
+    WITH group_members AS (
+        SELECT
+            g.id as group_id,
+            g.name as group_name,
+            gm.user_id,
+            count(*) OVER (PARTITION BY g.id) as member_count
+        FROM "group" g
+        JOIN group_member gm ON g.id = gm.group_id
+    ),
+    workspace_ids AS (
+        SELECT id FROM model
+    ),
+    user_usage AS (
+        SELECT
+            c.user_id,
+            m.value as workspace,
+            count(*) as chat_count,
+            sum(c.message_count) as message_count
+        FROM chat c, json_array_elements_text(c.chat->'models') AS m(value)
+        GROUP BY c.user_id, m.value
+    ),
+    user_fb AS (
+        SELECT
+            f.user_id,
+            count(*) as total_feedbacks
+        FROM feedback f
+        WHERE f.data->>'model_id' IN (SELECT id FROM workspace_ids)
+        GROUP BY f.user_id
+    )
+    SELECT
+        gm.group_id,
+        gm.group_name,
+        gm.member_count,
+        coalesce(sum(uu.chat_count), 0)::bigint as total_chats,
+        coalesce(sum(uu.message_count), 0)::bigint as total_messages,
+        coalesce(sum(ufb.total_feedbacks), 0)::bigint as total_feedbacks,
+        coalesce(round(coalesce(sum(uu.chat_count), 0)::numeric
+            / NULLIF(gm.member_count, 0), 1), 0)::float8 as chats_per_member,
+        coalesce(round(coalesce(sum(uu.message_count), 0)::numeric
+            / NULLIF(gm.member_count, 0), 1), 0)::float8 as messages_per_member
+    FROM group_members gm
+    LEFT JOIN user_usage uu ON gm.user_id = uu.user_id
+    LEFT JOIN user_fb ufb ON gm.user_id = ufb.user_id
+    GROUP BY gm.group_id, gm.group_name, gm.member_count
+    ORDER BY chats_per_member DESC NULLS LAST
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@v1.get("/stats/group-ranking", response_model=Page[GroupRankingItem])
+async def get_group_ranking(
+    request: Request,
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     response.headers["Cache-Control"] = "public, max-age=60"
-    rows = db.execute(text("""
-        WITH group_members AS (
-            SELECT
-                g.id as group_id,
-                g.name as group_name,
-                gm.user_id,
-                count(*) OVER (PARTITION BY g.id) as member_count
-            FROM "group" g
-            JOIN group_member gm ON g.id = gm.group_id
-        ),
-        workspace_ids AS (
-            SELECT id FROM model
-        ),
-        user_usage AS (
-            SELECT
-                c.user_id,
-                m.value as workspace,
-                count(*) as chat_count,
-                sum(json_array_length(c.chat->'messages')) as message_count
-            FROM chat c, json_array_elements_text(c.chat->'models') AS m(value)
-            GROUP BY c.user_id, m.value
-        ),
-        user_fb AS (
-            SELECT
-                f.user_id,
-                count(*) as total_feedbacks
-            FROM feedback f
-            WHERE f.data->>'model_id' IN (SELECT id FROM workspace_ids)
-            GROUP BY f.user_id
-        )
-        SELECT
-            gm.group_id,
-            gm.group_name,
-            gm.member_count,
-            coalesce(sum(uu.chat_count), 0) as total_chats,
-            coalesce(sum(uu.message_count), 0) as total_messages,
-            coalesce(sum(ufb.total_feedbacks), 0) as total_feedbacks,
-            round(coalesce(sum(uu.chat_count), 0)::numeric
-                / NULLIF(gm.member_count, 0), 1) as chats_per_member,
-            round(coalesce(sum(uu.message_count), 0)::numeric
-                / NULLIF(gm.member_count, 0), 1) as messages_per_member,
-            count(*) OVER() as _total
-        FROM group_members gm
-        LEFT JOIN user_usage uu ON gm.user_id = uu.user_id
-        LEFT JOIN user_fb ufb ON gm.user_id = ufb.user_id
-        GROUP BY gm.group_id, gm.group_name, gm.member_count
-        ORDER BY chats_per_member DESC NULLS LAST
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-
-    total = rows[0]["_total"] if rows else 0
-    return {
+    cache_key = ("group-ranking", offset, limit)
+    cached = _stats_cache.get(cache_key)
+    if cached:
+        return stats_response(request, response, *cached)
+    total = (await db.execute(GROUP_RANKING_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(GROUP_RANKING_SQL, {"limit": limit, "offset": offset})).mappings().all()
+
+    result = {
         "total": total,
         "offset": offset,
         "limit": limit,
-        "items": [
-            {
-                "group_id": row["group_id"],
-                "group_name": row["group_name"],
-                "member_count": row["member_count"],
-                "total_chats": int(row["total_chats"]),
-                "total_messages": int(row["total_messages"]),
-                "total_feedbacks": int(row["total_feedbacks"]),
-                "chats_per_member": float(row["chats_per_member"] or 0),
-                "messages_per_member": float(row["messages_per_member"] or 0),
-            }
-            for row in rows
-        ],
+        "items": [dict(row) for row in rows],
     }
+    etag = compute_etag(result)
+    _stats_cache[cache_key] = (result, etag)
+    return stats_response(request, response, result, etag)
 
 
 # ─── Tool & Function Registry ─────────────────────────────────────────
 
-@v1.get("/stats/tool-ranking")
-def get_tool_ranking(
+TOOL_RANKING_COUNT_SQL = text("SELECT count(*) FROM tool")
+
+TOOL_RANKING_SQL = text("""
+    SELECT
+        t.id,
+        t.name,
+        coalesce(u.name, '') as creator_name,
+        coalesce(u.email, '') as creator_email,
+        (to_timestamp(t.created_at) AT TIME ZONE 'Asia/Seoul')::text as created_at,
+        (to_timestamp(t.updated_at) AT TIME ZONE 'Asia/Seoul')::text as updated_at
+    FROM tool t
+    LEFT JOIN "user" u ON t.user_id = u.id
+    ORDER BY t.updated_at DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@v1.get("/stats/tool-ranking", response_model=Page[ToolRankingItem])
+async def get_tool_ranking(
+    request: Request,
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """List registered tools with creator info."""
     response.headers["Cache-Control"] = "public, max-age=60"
-    rows = db.execute(text("""
-        SELECT
-            t.id,
-            t.name,
-            u.name as creator_name,
-            u.email as creator_email,
-            to_timestamp(t.created_at) AT TIME ZONE 'Asia/Seoul' as created_at,
-            to_timestamp(t.updated_at) AT TIME ZONE 'Asia/Seoul' as updated_at,
-            count(*) OVER() as _total
-        FROM tool t
-        LEFT JOIN "user" u ON t.user_id = u.id
-        ORDER BY t.updated_at DESC
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-
-    total = rows[0]["_total"] if rows else 0
-    return {
+    cache_key = ("tool-ranking", offset, limit)
+    cached = _stats_cache.get(cache_key)
+    if cached:
+        return stats_response(request, response, *cached)
+    total = (await db.execute(TOOL_RANKING_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(TOOL_RANKING_SQL, {"limit": limit, "offset": offset})).mappings().all()
+
+    result = {
         "total": total,
         "offset": offset,
         "limit": limit,
-        "items": [
-            {
-                "id": row["id"],
-                "name": row["name"],
-                "creator_name": row["creator_name"] or "",
-                "creator_email": row["creator_email"] or "",
-                "created_at": str(row["created_at"]),
-                "updated_at": str(row["updated_at"]),
-            }
-            for row in rows
-        ],
+        "items": [dict(row) for row in rows],
     }
-
-
-@v1.get("/stats/function-ranking")
-def get_function_ranking(
+    etag = compute_etag(result)
+    _stats_cache[cache_key] = (result, etag)
+    return stats_response(request, response, result, etag)
+
+
+FUNCTION_RANKING_COUNT_SQL = text("SELECT count(*) FROM function")
+
+FUNCTION_RANKING_SQL = text("""
+    SELECT
+        f.id,
+        f.name,
+        f.type,
+        f.is_active,
+        f.is_global,
+        coalesce(u.name, '') as creator_name,
+        coalesce(u.email, '') as creator_email,
+        (to_timestamp(f.created_at) AT TIME ZONE 'Asia/Seoul')::text as created_at,
+        (to_timestamp(f.updated_at) AT TIME ZONE 'Asia/Seoul')::text as updated_at
+    FROM function f
+    LEFT JOIN "user" u ON f.user_id = u.id
+    ORDER BY f.updated_at DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@v1.get("/stats/function-ranking", response_model=Page[FunctionRankingItem])
+async def get_function_ranking(
+    request: Request,
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """List registered functions (pipes, filters, actions) with creator info."""
     response.headers["Cache-Control"] = "public, max-age=60"
-    rows = db.execute(text("""
-        SELECT
-            f.id,
-            f.name,
-            f.type,
-            f.is_active,
-            f.is_global,
-            u.name as creator_name,
-            u.email as creator_email,
-            to_timestamp(f.created_at) AT TIME ZONE 'Asia/Seoul' as created_at,
-            to_timestamp(f.updated_at) AT TIME ZONE 'Asia/Seoul' as updated_at,
-            count(*) OVER() as _total
-        FROM function f
-        LEFT JOIN "user" u ON f.user_id = u.id
-        ORDER BY f.updated_at DESC
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-
-    total = rows[0]["_total"] if rows else 0
-    return {
+    cache_key = ("function-ranking", offset, limit)
+    cached = _stats_cache.get(cache_key)
+    if cached:
+        return stats_response(request, response, *cached)
+    total = (await db.execute(FUNCTION_RANKING_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(FUNCTION_RANKING_SQL, {"limit": limit, "offset": offset})).mappings().all()
+
+    result = {
         "total": total,
         "offset": offset,
         "limit": limit,
-        "items": [
-            {
-                "id": row["id"],
-                "name": row["name"],
-                "type": row["type"],
-                "is_active": row["is_active"],
-                "is_global": row["is_global"],
-                "creator_name": row["creator_name"] or "",
-                "creator_email": row["creator_email"] or "",
-                "created_at": str(row["created_at"]),
-                "updated_at": str(row["updated_at"]),
-            }
-            for row in rows
-        ],
+        "items": [dict(row) for row in rows],
     }
-
-
-@v1.get("/stats/skill-ranking")
-def get_skill_ranking(
+    etag = compute_etag(result)
+    _stats_cache[cache_key] = (result, etag)
+    return stats_response(request, response, result, etag)
+
+
+SKILL_RANKING_COUNT_SQL = text("SELECT count(*) FROM skill")
+
+SKILL_RANKING_SQL = text("""
+    SELECT
+        s.id,
+        s.name,
+        left(coalesce(s.description, ''), 120) as description,
+        s.is_active,
+        coalesce(u.name, '') as creator_name,
+        coalesce(u.email, '') as creator_email,
+        (to_timestamp(s.created_at) AT TIME ZONE 'Asia/Seoul')::text as created_at,
+        (to_timestamp(s.updated_at) AT TIME ZONE 'Asia/Seoul')::text as updated_at
+    FROM skill s
+    LEFT JOIN "user" u ON s.user_id = u.id
+    ORDER BY s.updated_at DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@v1.get("/stats/skill-ranking", response_model=Page[SkillRankingItem])
+async def get_skill_ranking(
+    request: Request,
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """List registered skills with creator info."""
     response.headers["Cache-Control"] = "public, max-age=60"
-    rows = db.execute(text("""
-        SELECT
-            s.id,
-            s.name,
-            s.description,
-            s.is_active,
-            u.name as creator_name,
-            u.email as creator_email,
-            to_timestamp(s.created_at) AT TIME ZONE 'Asia/Seoul' as created_at,
-            to_timestamp(s.updated_at) AT TIME ZONE 'Asia/Seoul' as updated_at,
-            count(*) OVER() as _total
-        FROM skill s
-        LEFT JOIN "user" u ON s.user_id = u.id
-        ORDER BY s.updated_at DESC
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-
-    total = rows[0]["_total"] if rows else 0
-    return {
+    cache_key = ("skill-ranking", offset, limit)
+    cached = _stats_cache.get(cache_key)
+    if cached:
+        return stats_response(request, response, *cached)
+    total = (await db.execute(SKILL_RANKING_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(SKILL_RANKING_SQL, {"limit": limit, "offset": offset})).mappings().all()
+
+    result = {
         "total": total,
         "offset": offset,
         "limit": limit,
-        "items": [
-            {
-                "id": row["id"],
-                "name": row["name"],
-                "description": (row["description"] or "")[:120],
-                "is_active": row["is_active"],
-                "creator_name": row["creator_name"] or "",
-                "creator_email": row["creator_email"] or "",
-                "created_at": str(row["created_at"]),
-                "updated_at": str(row["updated_at"]),
-            }
-            for row in rows
-        ],
+        "items": [dict(row) for row in rows],
     }
+    etag = compute_etag(result)
+    _stats_cache[cache_key] = (result, etag)
+    return stats_response(request, response, result, etag)
 
 
 # ─── Auth ──────────────────────────────────────────────────────────────
 
 @v1.get("/auth/me")
-def get_me(current_user: str = Depends(get_current_user)):
+async def get_me(current_user: str = Depends(get_current_user)):
     return {"user": current_user, "is_admin": current_user in ADMIN_USERS}
 
 
 # ─── Python Packages ──────────────────────────────────────────────────
 
-@v1.get("/packages")
-def list_packages(
+PACKAGES_COUNT_SQL = text("SELECT count(*) FROM python_packages")
+
+PACKAGES_SQL = text("""
+    SELECT id, package_name, added_by,
+           to_char(added_at AT TIME ZONE 'Asia/Seoul', 'YYYY-MM-DD HH24:MI:SS') as added_at,
+           status, status_note
+    FROM python_packages
+    ORDER BY python_packages.added_at DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@v1.get("/packages", response_model=Page[PackageOut])
+async def list_packages(
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     response.headers["Cache-Control"] = "no-cache"
-    rows = db.execute(text("""
-        SELECT id, package_name, added_by,
-               added_at AT TIME ZONE 'Asia/Seoul' as added_at,
-               status, status_note,
-               count(*) OVER() as _total
-        FROM python_packages
-        ORDER BY added_at DESC
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-    total = rows[0]["_total"] if rows else 0
+    total = (await db.execute(PACKAGES_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(PACKAGES_SQL, {"limit": limit, "offset": offset})).mappings().all()
     return {
         "total": total,
         "offset": offset,
         "limit": limit,
-        "items": [
-            {
-                "id": row["id"],
-                "package_name": row["package_name"],
-                "added_by": row["added_by"],
-                "added_at": str(row["added_at"]),
-                "status": row["status"],
-                "status_note": row["status_note"],
-            }
-            for row in rows
-        ],
+        "items": [dict(row) for row in rows],
     }
 
 
-@v1.post("/packages", status_code=201)
-def add_package(
+# Audit rows are written in the same statement as the package change, so the log
+# commits or rolls back with it and costs no extra round-trip
+ADD_PACKAGE_SQL = text("""
+    WITH ins AS (
+        INSERT INTO python_packages (package_name, added_by)
+        VALUES (:name, :user)
+        ON CONFLICT (package_name) DO NOTHING
+        RETURNING id, package_name, added_by, added_at, status, status_note
+    ), audit AS (
+        INSERT INTO package_audit_log (package_id, package_name, action, performed_by)
+        SELECT id, package_name, 'added', added_by FROM ins
+    )
+    SELECT id, package_name, added_by,
+           to_char(added_at AT TIME ZONE 'Asia/Seoul', 'YYYY-MM-DD HH24:MI:SS') as added_at,
+           status, status_note
+    FROM ins
+""")
+
+
+@v1.post("/packages", status_code=201, response_model=PackageOut)
+async def add_package(
     body: PackageCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
 ):
     name = body.package_name.strip().lower()
     if not name:
         raise HTTPException(status_code=400, detail="Package name cannot be empty")
-    if not re.match(r'^[a-zA-Z0-9._\-\[\]>=<!, ]+$', name):
+    if not PACKAGE_NAME_RE.match(name):
         raise HTTPException(status_code=400, detail="Invalid package name format")
     try:
-        result = db.execute(
-            text("""INSERT INTO python_packages (package_name, added_by)
-                    VALUES (:name, :user)
-                    RETURNING id, package_name, added_by,
-                              added_at AT TIME ZONE 'Asia/Seoul' as added_at,
-                              status, status_note"""),
+        # The audit row is written in the same statement as the package row
+        result = await db.execute(
+            ADD_PACKAGE_SQL,
             {"name": name, "user": current_user},
         )
         row = result.mappings().first()
-        log_audit(db, row["id"], name, "added", current_user)
-        db.commit()
-        return {
-            "id": row["id"],
-            "package_name": row["package_name"],
-            "added_by": row["added_by"],
-            "added_at": str(row["added_at"]),
-            "status": row["status"],
-            "status_note": row["status_note"],
-        }
-    except Exception as e:
-        db.rollback()
-        if "unique" in str(e).lower() or "duplicate" in str(e).lower():
+        if row:
+            await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if e.orig.sqlstate == "23505":
             raise HTTPException(status_code=409, detail=f"Package '{name}' already exists")
         logger.exception("Failed to add package '%s'", name)
         raise HTTPException(status_code=500, detail="Internal server error")
+    except Exception:
+        await db.rollback()
+        logger.exception("Failed to add package '%s'", name)
+        raise HTTPException(status_code=500, detail="Internal server error")
+    if not row:
+        raise HTTPException(status_code=409, detail=f"Package '{name}' already exists")
+    return dict(row)
+
+
+DELETE_PACKAGE_SQL = text("""
+    WITH del AS (
+        DELETE FROM python_packages
+        WHERE id = :id AND (added_by = :user OR :is_admin)
+        RETURNING id, package_name
+    )
+    INSERT INTO package_audit_log (package_id, package_name, action, performed_by)
+    SELECT id, package_name, 'deleted', :user FROM del
+    RETURNING package_id
+""")
+
+PACKAGE_EXISTS_SQL = text("SELECT 1 FROM python_packages WHERE id = :id")
 
 
 @v1.delete("/packages/{package_id}")
-def delete_package(
+async def delete_package(
     package_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
 ):
-    row = db.execute(
-        text("SELECT id, added_by, package_name FROM python_packages WHERE id = :id"),
-        {"id": package_id},
-    ).mappings().first()
-    if not row:
-        raise HTTPException(status_code=404, detail="Package not found")
-    if row["added_by"] != current_user and current_user not in ADMIN_USERS:
+    deleted = (await db.execute(
+        DELETE_PACKAGE_SQL,
+        {"id": package_id, "user": current_user, "is_admin": current_user in ADMIN_USERS},
+    )).first()
+    if not deleted:
+        exists = (await db.execute(
+            PACKAGE_EXISTS_SQL,
+            {"id": package_id},
+        )).first()
+        if not exists:
+            raise HTTPException(status_code=404, detail="Package not found")
         raise HTTPException(status_code=403, detail="You can only delete packages you added")
-    db.execute(text("DELETE FROM python_packages WHERE id = :id"), {"id": package_id})
-    log_audit(db, package_id, row["package_name"], "deleted", current_user)
-    db.commit()
+    await db.commit()
     return {"ok": True}
 
 
+UPDATE_PACKAGE_STATUS_SQL = text("""
+    WITH upd AS (
+        UPDATE python_packages
+        SET status = :status, status_note = :note,
+            status_updated_by = :user, status_updated_at = NOW()
+        WHERE id = :id
+        RETURNING id, package_name
+    )
+    INSERT INTO package_audit_log (package_id, package_name, action, performed_by, detail)
+    SELECT id, package_name, :action, :user, :note FROM upd
+    RETURNING package_id
+""")
+
+
 @v1.patch("/packages/{package_id}/status")
-def update_package_status(
+async def update_package_status(
     package_id: int,
     body: PackageStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
 ):
     if current_user not in ADMIN_USERS:
         raise HTTPException(status_code=403, detail="Only admins can change package status")
     if body.status not in ("pending", "installed", "rejected", "uninstalled"):
         raise HTTPException(status_code=400, detail="Status must be pending, installed, rejected, or uninstalled")
-    row = db.execute(
-        text("SELECT id, package_name FROM python_packages WHERE id = :id"),
-        {"id": package_id},
-    ).mappings().first()
-    if not row:
+    updated = (await db.execute(
+        UPDATE_PACKAGE_STATUS_SQL,
+        {
+            "id": package_id,
+            "status": body.status,
+            "note": body.status_note,
+            "user": current_user,
+            "action": f"status:{body.status}",
+        },
+    )).first()
+    if not updated:
         raise HTTPException(status_code=404, detail="Package not found")
-    db.execute(
-        text("""UPDATE python_packages
-                SET status = :status, status_note = :note,
-                    status_updated_by = :user, status_updated_at = NOW()
-                WHERE id = :id"""),
-        {"id": package_id, "status": body.status, "note": body.status_note, "user": current_user},
-    )
-    log_audit(db, package_id, row["package_name"], f"status:{body.status}", current_user, body.status_note)
-    db.commit()
+    await db.commit()
     return {"ok": True}
 
 
 # ─── Package Audit Log ───────────────────────────────────────────────
 
-@v1.get("/packages/audit-log")
-def get_audit_log(
+AUDIT_LOG_COUNT_SQL = text("SELECT count(*) FROM package_audit_log")
+
+AUDIT_LOG_SQL = text("""
+    SELECT id, package_id, package_name, action, performed_by, detail,
+           to_char(created_at AT TIME ZONE 'Asia/Seoul', 'YYYY-MM-DD HH24:MI:SS') as created_at
+    FROM package_audit_log
+    ORDER BY package_audit_log.created_at DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+@v1.get("/packages/audit-log", response_model=Page[AuditLogEntry])
+async def get_audit_log(
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
 ):
     """Admin-only endpoint to query the package audit log."""
     if current_user not in ADMIN_USERS:
         raise HTTPException(status_code=403, detail="Admin access required")
     response.headers["Cache-Control"] = "no-cache"
-    rows = db.execute(text("""
-        SELECT id, package_id, package_name, action, performed_by, detail,
-               created_at AT TIME ZONE 'Asia/Seoul' as created_at,
-               count(*) OVER() as _total
-        FROM package_audit_log
-        ORDER BY created_at DESC
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-    total = rows[0]["_total"] if rows else 0
+    total = (await db.execute(AUDIT_LOG_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(AUDIT_LOG_SQL, {"limit": limit, "offset": offset})).mappings().all()
     return {
         "total": total,
         "offset": offset,
         "limit": limit,
-        "items": [
-            {
-                "id": row["id"],
-                "package_id": row["package_id"],
-                "package_name": row["package_name"],
-                "action": row["action"],
-                "performed_by": row["performed_by"],
-                "detail": row["detail"],
-                "created_at": str(row["created_at"]),
-            }
-            for row in rows
-        ],
+        "items": [dict(row) for row in rows],
     }
 
 
@@ -871,27 +1199,31 @@ VALID_REPORT_CATEGORIES = ("bug", "feature", "question", "other")
 VALID_REPORT_STATUSES = ("open", "in_progress", "resolved", "rejected", "wontfix")
 
 
+REPORTS_COUNT_SQL = text("SELECT count(*) FROM issue_reports")
+
+REPORTS_SQL = text("""
+    SELECT id, title, description, category, reported_by, is_anonymous,
+           status, admin_note,
+           to_char(created_at AT TIME ZONE 'Asia/Seoul', 'YYYY-MM-DD HH24:MI:SS') as created_at,
+           to_char(updated_at AT TIME ZONE 'Asia/Seoul', 'YYYY-MM-DD HH24:MI:SS') as updated_at
+    FROM issue_reports
+    ORDER BY issue_reports.created_at DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
 @v1.get("/reports")
-def list_reports(
+async def list_reports(
     response: Response,
     offset: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
 ):
     response.headers["Cache-Control"] = "no-cache"
     is_admin = current_user in ADMIN_USERS
-    rows = db.execute(text("""
-        SELECT id, title, description, category, reported_by, is_anonymous,
-               status, admin_note,
-               created_at AT TIME ZONE 'Asia/Seoul' as created_at,
-               updated_at AT TIME ZONE 'Asia/Seoul' as updated_at,
-               count(*) OVER() as _total
-        FROM issue_reports
-        ORDER BY created_at DESC
-        LIMIT :limit OFFSET :offset
-    """), {"limit": limit, "offset": offset}).mappings().all()
-    total = rows[0]["_total"] if rows else 0
+    total = (await db.execute(REPORTS_COUNT_SQL)).scalar_one()
+    rows = (await db.execute(REPORTS_SQL, {"limit": limit, "offset": offset})).mappings().all()
     items = []
     for row in rows:
         item = {
@@ -903,8 +1235,8 @@ def list_reports(
             "is_anonymous": row["is_anonymous"],
             "status": row["status"],
             "admin_note": row["admin_note"],
-            "created_at": str(row["created_at"]),
-            "updated_at": str(row["updated_at"]),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
         }
         # Admin can see real author even for anonymous reports
         if is_admin and row["is_anonymous"]:
@@ -918,10 +1250,20 @@ def list_reports(
     }
 
 
+CREATE_REPORT_SQL = text("""
+    INSERT INTO issue_reports (title, description, category, reported_by, is_anonymous)
+    VALUES (:title, :desc, :cat, :user, :anon)
+    RETURNING id, title, description, category, reported_by, is_anonymous,
+              status, admin_note,
+              to_char(created_at AT TIME ZONE 'Asia/Seoul', 'YYYY-MM-DD HH24:MI:SS') as created_at,
+              to_char(updated_at AT TIME ZONE 'Asia/Seoul', 'YYYY-MM-DD HH24:MI:SS') as updated_at
+""")
+
+
 @v1.post("/reports", status_code=201)
-def create_report(
+async def create_report(
     body: ReportCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
 ):
     if not body.title.strip():
@@ -931,13 +1273,8 @@ def create_report(
     if body.category not in VALID_REPORT_CATEGORIES:
         raise HTTPException(status_code=400, detail=f"Category must be one of: {', '.join(VALID_REPORT_CATEGORIES)}")
     try:
-        result = db.execute(
-            text("""INSERT INTO issue_reports (title, description, category, reported_by, is_anonymous)
-                    VALUES (:title, :desc, :cat, :user, :anon)
-                    RETURNING id, title, description, category, reported_by, is_anonymous,
-                              status, admin_note,
-                              created_at AT TIME ZONE 'Asia/Seoul' as created_at,
-                              updated_at AT TIME ZONE 'Asia/Seoul' as updated_at"""),
+        result = await db.execute(
+            CREATE_REPORT_SQL,
             {
                 "title": body.title.strip(),
                 "desc": body.description.strip(),
@@ -947,7 +1284,7 @@ def create_report(
             },
         )
         row = result.mappings().first()
-        db.commit()
+        await db.commit()
         return {
             "id": row["id"],
             "title": row["title"],
@@ -957,59 +1294,71 @@ def create_report(
             "is_anonymous": row["is_anonymous"],
             "status": row["status"],
             "admin_note": row["admin_note"],
-            "created_at": str(row["created_at"]),
-            "updated_at": str(row["updated_at"]),
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
         }
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.exception("Failed to create report")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+REPORT_EXISTS_SQL = text("SELECT id FROM issue_reports WHERE id = :id")
+
+UPDATE_REPORT_STATUS_SQL = text("""
+    UPDATE issue_reports
+    SET status = :status, admin_note = :note,
+        status_updated_by = :user, updated_at = NOW()
+    WHERE id = :id
+""")
+
+
 @v1.patch("/reports/{report_id}/status")
-def update_report_status(
+async def update_report_status(
     report_id: int,
     body: ReportStatusUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
 ):
     if current_user not in ADMIN_USERS:
         raise HTTPException(status_code=403, detail="Only admins can change report status")
     if body.status not in VALID_REPORT_STATUSES:
         raise HTTPException(status_code=400, detail=f"Status must be one of: {', '.join(VALID_REPORT_STATUSES)}")
-    row = db.execute(
-        text("SELECT id FROM issue_reports WHERE id = :id"),
+    row = (await db.execute(
+        REPORT_EXISTS_SQL,
         {"id": report_id},
-    ).mappings().first()
+    )).mappings().first()
     if not row:
         raise HTTPException(status_code=404, detail="Report not found")
-    db.execute(
-        text("""UPDATE issue_reports
-                SET status = :status, admin_note = :note,
-                    status_updated_by = :user, updated_at = NOW()
-                WHERE id = :id"""),
+    await db.execute(
+        UPDATE_REPORT_STATUS_SQL,
         {"id": report_id, "status": body.status, "note": body.admin_note, "user": current_user},
     )
-    db.commit()
+    await db.commit()
     return {"ok": True}
 
 
+REPORT_OWNER_SQL = text("SELECT id, reported_by FROM issue_reports WHERE id = :id")
+
+DELETE_REPORT_SQL = text("DELETE FROM issue_reports WHERE id = :id")
+
+
 @v1.delete("/reports/{report_id}")
-def delete_report(
+async def delete_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: str = Depends(get_current_user),
 ):
-    row = db.execute(
-        text("SELECT id, reported_by FROM issue_reports WHERE id = :id"),
+    row = (await db.execute(
+        REPORT_OWNER_SQL,
         {"id": report_id},
-    ).mappings().first()
+    )).mappings().first()
     if not row:
         raise HTTPException(status_code=404, detail="Report not found")
     if row["reported_by"] != current_user and current_user not in ADMIN_USERS:
         raise HTTPException(status_code=403, detail="You can only delete your own reports")
-    db.execute(text("DELETE FROM issue_reports WHERE id = :id"), {"id": report_id})
-    db.commit()
+    await db.execute(DELETE_REPORT_SQL, {"id": report_id})
+    await db.commit()
     return {"ok": True}
 
 